@@ -20,13 +20,24 @@ Literature
   GEOPHYSICS 36, no. 5 (January 1, 1971): 943–59. doi:10.1190/1.1440226.
 
 """
+import os
+
 import numpy as np
 import pandas as pd
 
 import crtomo.mpl
 
 import reda.configs.configManager as reda_config_mgr
-plt, mpl = crtomo.mpl.setup()
+
+# record layout of binary CRMod measurement files (see
+# ConfigManager.write_crmod_volt_binary). The file starts with the number of
+# records as one little-endian int32.
+volt_binary_dtype = np.dtype([
+    ('ab', '<i4'),
+    ('mn', '<i4'),
+    ('mag', '<f8'),
+    ('pha', '<f8'),
+])
 
 
 class ConfigManager(reda_config_mgr.ConfigManager):
@@ -42,6 +53,15 @@ class ConfigManager(reda_config_mgr.ConfigManager):
         self.measurements = {}
         # global counter for measurements
         self.meas_counter = - 1
+        # the measurement arrays in self.measurements are views into the rows
+        # of one contiguous KxN matrix. Rows of deleted measurements are never
+        # reused (views held elsewhere stay valid); instead, the matrix is
+        # compacted into a new buffer once more than half of its used rows are
+        # deleted.
+        self._meas_matrix = None
+        self._meas_nr_rows = 0
+        # measurement id -> row in self._meas_matrix
+        self._meas_rows = {}
 
     def clear_measurements(self):
         """Remove all measurements from self.measurements. Reset the
@@ -51,11 +71,84 @@ class ConfigManager(reda_config_mgr.ConfigManager):
         for key in keys:
             del(self.measurements[key])
         self.meas_counter = -1
+        self._meas_matrix = None
+        self._meas_nr_rows = 0
+        self._meas_rows = {}
 
     def delete_measurements(self, mid):
         del(self.measurements[mid])
+        if self._meas_rows.pop(mid, None) is not None:
+            self._untrack_rebound_measurements()
+            nr_deleted_rows = self._meas_nr_rows - len(self._meas_rows)
+            if nr_deleted_rows > len(self._meas_rows):
+                self._compact_measurement_matrix()
+
+    def _untrack_rebound_measurements(self):
+        """Stop tracking measurements whose entry in self.measurements is not
+        a view of the measurement matrix any more, i.e., measurements that
+        were replaced by the caller.
+        """
+        for key in list(self._meas_rows.keys()):
+            value = self.measurements.get(key)
+            if(not isinstance(value, np.ndarray) or
+               value.base is not self._meas_matrix):
+                del(self._meas_rows[key])
+
+    def _compact_measurement_matrix(self):
+        """Copy all live rows of the measurement matrix into a new, tightly
+        sized matrix and point the stored measurements to it. The matrix is
+        released completely if no measurements are left. Views of the old
+        matrix are left untouched.
+        """
+        self._untrack_rebound_measurements()
+        if len(self._meas_rows) == 0:
+            self._meas_matrix = None
+        else:
+            keys = sorted(self._meas_rows.keys())
+            rows = [self._meas_rows[key] for key in keys]
+            self._meas_matrix = self._meas_matrix[rows]
+            for row, key in enumerate(keys):
+                self._meas_rows[key] = row
+                self.measurements[key] = self._meas_matrix[row]
+        self._meas_nr_rows = len(self._meas_rows)
+
+    def _store_measurement(self, cid, dataset):
+        """Copy one measurement set into the next unused row of the measurement
+        matrix and register the row view in self.measurements. The capacity of
+        the matrix is doubled when it is full.
+        """
+        if dataset.dtype != np.float64:
+            # only float data is kept in the matrix
+            self.measurements[cid] = dataset.copy()
+            return
 
-    def add_measurements(self, measurements):
+        nr_of_configs = self.configs.shape[0]
+        if(self._meas_matrix is None or
+           self._meas_matrix.shape[1] != nr_of_configs):
+            # start a new matrix. Measurements in an old matrix remain valid,
+            # but are not tracked any more
+            self._meas_matrix = np.empty((1, nr_of_configs), dtype=np.float64)
+            self._meas_nr_rows = 0
+            self._meas_rows = {}
+        elif self._meas_nr_rows == self._meas_matrix.shape[0]:
+            self._untrack_rebound_measurements()
+            new_matrix = np.empty(
+                (max(1, 2 * self._meas_matrix.shape[0]), nr_of_configs),
+                dtype=np.float64,
+            )
+            new_matrix[0:self._meas_nr_rows] = self._meas_matrix
+            self._meas_matrix = new_matrix
+            # point all tracked measurements to the new matrix
+            for key, row in self._meas_rows.items():
+                self.measurements[key] = self._meas_matrix[row]
+
+        row = self._meas_nr_rows
+        self._meas_nr_rows += 1
+        self._meas_matrix[row] = dataset
+        self._meas_rows[cid] = row
+        self.measurements[cid] = self._meas_matrix[row]
+
+    def add_measurements(self, measurements, copy=True):
         """Add new measurements to this instance
 
         Parameters
@@ -64,6 +157,12 @@ class ConfigManager(reda_config_mgr.ConfigManager):
             one or more measurement sets. It must either be 1D or 2D, with the
             first dimension the number of measurement sets (K), and the second
             the number of measurements (N): K x N
+        copy: bool, optional
+            if True (default), copy the measurement sets into a buffer shared
+            by all measurements of this instance; self.measurements then holds
+            views into this buffer, and each view keeps the whole buffer
+            alive. If False, store (views of) the provided data directly. In
+            this case the caller must not modify the array afterwards.
 
         Returns
         -------
@@ -83,13 +182,24 @@ class ConfigManager(reda_config_mgr.ConfigManager):
             print(config.measurements[mid])
 
         """
-        subdata = np.atleast_2d(measurements)
-
         if self.configs is None:
             raise Exception(
                 'must read in configuration before measurements can be stored'
             )
 
+        measurements = np.asarray(measurements)
+        # one measurement set: store it directly
+        if(measurements.ndim == 1 and
+           measurements.size == self.configs.shape[0]):
+            cid = self._get_next_index()
+            if copy:
+                self._store_measurement(cid, measurements)
+            else:
+                self.measurements[cid] = measurements
+            return cid
+
+        subdata = np.atleast_2d(measurements)
+
         # we try to accommodate transposed input
         if subdata.shape[1] != self.configs.shape[0]:
             if subdata.shape[0] == self.configs.shape[0]:
@@ -98,11 +208,15 @@ class ConfigManager(reda_config_mgr.ConfigManager):
                 raise Exception(
                     'Number of measurements does not match number of configs'
                 )
+        subdata = np.ascontiguousarray(subdata)
 
         return_ids = []
         for dataset in subdata:
             cid = self._get_next_index()
-            self.measurements[cid] = dataset.copy()
+            if copy:
+                self._store_measurement(cid, dataset)
+            else:
+                self.measurements[cid] = dataset
             return_ids.append(cid)
 
         if len(return_ids) == 1:
@@ -142,6 +256,9 @@ class ConfigManager(reda_config_mgr.ConfigManager):
         """ ??? DEFUNCT
 
         """
+        # only set up matplotlib when we actually plot
+        plt, mpl = crtomo.mpl.setup()
+
         R = None
         fig, axes = plt.subplots(1, 2, figsize=(10, 6))
 
@@ -189,17 +306,15 @@ class ConfigManager(reda_config_mgr.ConfigManager):
             Skip used for voltage electrodes. Default: 0
 
         """
-        new_configs = []
-        for ab in cinj:
-            for i in range(1, self.nr_electrodes + 1):
-                m = i
-                n = i + skip + 1
-                if m in ab or n in ab:
-                    continue
-                if n > self.nr_electrodes:
-                    continue
-                new_configs.append((ab[0], ab[1], m, n))
-        configs = np.array(new_configs)
+        cinj = np.atleast_2d(cinj)
+        # all voltage dipoles that fit into the electrode range
+        m = np.arange(1, self.nr_electrodes - skip)
+        n = m + skip + 1
+        M, A = np.meshgrid(m, cinj[:, 0])
+        N, B = np.meshgrid(n, cinj[:, 1])
+        # voltage electrodes must not coincide with current electrodes
+        valid = (M != A) & (M != B) & (N != A) & (N != B)
+        configs = np.stack((A, B, M, N), axis=-1)[valid]
         self.add_to_configs(configs)
         return configs
 
@@ -222,12 +337,20 @@ class ConfigManager(reda_config_mgr.ConfigManager):
         if isinstance(data_source, str):
             with open(data_source, 'r') as fid:
                 nr_of_configs = int(fid.readline().strip())
-                measurements = np.loadtxt(fid)
-                if nr_of_configs != measurements.shape[0]:
-                    raise Exception(
-                        'indicated number of measurements does not equal '
-                        'to actual number of measurements'
-                    )
+            measurements = pd.read_csv(
+                data_source,
+                sep=r'\s+',
+                header=None,
+                skiprows=1,
+                engine='c',
+                dtype=np.float64,
+                memory_map=True,
+            ).to_numpy()
+            if nr_of_configs != measurements.shape[0]:
+                raise Exception(
+                    'indicated number of measurements does not equal '
+                    'to actual number of measurements'
+                )
         elif isinstance(data_source, pd.DataFrame):
             measurements = data_source[
                 ['a', 'b', 'm', 'n', 'r', 'rpha']
@@ -249,6 +372,16 @@ class ConfigManager(reda_config_mgr.ConfigManager):
             rmag = measurements[:, 4]
             rpha = measurements[:, 5]
 
+        self._set_or_check_configs(abmn)
+        # add data
+        cid_mag = self.add_measurements(rmag)
+        cid_pha = self.add_measurements(rpha)
+        return cid_mag, cid_pha
+
+    def _set_or_check_configs(self, abmn):
+        """Use abmn as configurations if none are stored yet, otherwise make
+        sure that they match the stored configurations
+        """
         if self.configs is None:
             self.configs = abmn
         else:
@@ -258,10 +391,6 @@ class ConfigManager(reda_config_mgr.ConfigManager):
                     'previously stored configurations do not match new '
                     'configurations'
                 )
-        # add data
-        cid_mag = self.add_measurements(rmag)
-        cid_pha = self.add_measurements(rpha)
-        return cid_mag, cid_pha
 
     def load_crmod_volt(self, filename):
         """Load a CRMod measurement file (commonly called volt.dat)
@@ -281,6 +410,79 @@ class ConfigManager(reda_config_mgr.ConfigManager):
         cid_mag, cid_pha = self.load_crmod_data(filename)
         return cid_mag, cid_pha
 
+    def load_crmod_volt_binary(self, filename):
+        """Load a binary CRMod measurement file, as written by
+        :py:meth:`write_crmod_volt_binary`. The file is memory-mapped, i.e.,
+        no text parsing is required and the magnitude and phase data are
+        copied only once, directly into the measurement storage.
+
+        Parameters
+        ----------
+        filename : string
+            path to input filename
+
+        Returns
+        -------
+        cid_mag : int
+            Measurement id for magnitude data
+        cid_pha : int
+            Measurement id for phase data
+        """
+        with open(filename, 'rb') as fid:
+            nr_of_configs = int(np.fromfile(fid, dtype='<i4', count=1)[0])
+        data_size = os.path.getsize(filename) - 4
+        if data_size != nr_of_configs * volt_binary_dtype.itemsize:
+            raise Exception(
+                'indicated number of measurements does not equal '
+                'to actual number of measurements'
+            )
+        data = np.memmap(
+            filename, dtype=volt_binary_dtype, mode='r', offset=4,
+            shape=(nr_of_configs, ),
+        )
+        abmn = self._crmod_to_abmn(
+            np.column_stack((data['ab'], data['mn']))
+        )
+        self._set_or_check_configs(abmn)
+
+        cid_mag = self.add_measurements(data['mag'])
+        cid_pha = self.add_measurements(data['pha'])
+        return cid_mag, cid_pha
+
+    def write_crmod_volt_binary(self, filename, mid):
+        """Write the measurements to a binary file that can be loaded with
+        :py:meth:`load_crmod_volt_binary`. The file holds the number of
+        configurations (int32), followed by one record (int32 AB, int32 MN,
+        float64 magnitude, float64 phase) for each configuration.
+
+        Parameters
+        ----------
+        filename: string
+            output filename
+        mid: int or [int, int]
+            measurement ids of magnitude and phase measurements. If only one ID
+            is given, then the phase column is filled with zeros
+
+        """
+        ABMN = self._get_crmod_abmn()
+
+        if isinstance(mid, (list, tuple)):
+            mag_data = self.measurements[mid[0]]
+            pha_data = self.measurements[mid[1]]
+        else:
+            mag_data = self.measurements[mid]
+            pha_data = np.zeros(mag_data.shape)
+
+        data = np.empty(ABMN.shape[0], dtype=volt_binary_dtype)
+        data['ab'] = ABMN[:, 0]
+        data['mn'] = ABMN[:, 1]
+        data['mag'] = mag_data
+        data['pha'] = pha_data
+
+        with open(filename, 'wb') as fid:
+            np.array(data.shape[0], dtype='<i4').tofile(fid)
+            data.tofile(fid)
+
     def delete_data_points(self, indices):
         """Delete data points by index (0-indexed), both in configs and
         measurements. Deletions will be done in ALL registered measurements to
@@ -297,7 +499,18 @@ class ConfigManager(reda_config_mgr.ConfigManager):
         # first the configurations
         self.configs = np.delete(self.configs, indices, axis=0)
 
-        for key in sorted(self.measurements.keys()):
-            self.measurements[key] = np.delete(
-                self.measurements[key], indices, axis=0
+        if self._meas_matrix is not None:
+            self._untrack_rebound_measurements()
+            self._meas_matrix = np.delete(
+                self._meas_matrix[0:self._meas_nr_rows], indices, axis=1
             )
+
+        for key in sorted(self.measurements.keys()):
+            if key in self._meas_rows:
+                self.measurements[key] = self._meas_matrix[
+                    self._meas_rows[key]
+                ]
+            else:
+                self.measurements[key] = np.delete(
+                    self.measurements[key], indices, axis=0
+                )
@@ -102,6 +102,10 @@ class crt_grid(object):
 
         # will be used for caching by .get_element_centroids
         self.centroids = None
+        # will be used for caching by .get_element_areas
+        self.element_areas = None
+        # will be used for caching by .get_element_polygons
+        self.element_polygons = None
 
         if elem_file is not None:
             self.load_elem_file(elem_file)
@@ -238,13 +242,24 @@ class crt_grid(object):
 
         # Rearrange nodes when CutMcK was used.
         if(self.header['cutmck']):
+            # for each node number (1 to N), find the row in which it is
+            # stored, using a binary search in the sorted node numbers
+            node_numbers = nodes_raw[:, 0].astype(int)
+            sort_index = np.argsort(node_numbers, kind='stable')
+            positions = np.searchsorted(
+                node_numbers[sort_index],
+                np.arange(1, self.header['nr_nodes'] + 1)
+            )
+            positions = np.clip(positions, 0, sort_index.size - 1)
+            nodes_cutmck_index = sort_index[positions]
+            if np.any(
+                    node_numbers[nodes_cutmck_index] !=
+                    np.arange(1, self.header['nr_nodes'] + 1)):
+                raise Exception('Node numbers in elem.dat are not consistent')
+
             nodes_cutmck = np.empty_like(nodes_raw)
-            nodes_cutmck_index = np.zeros(nodes_raw.shape[0], dtype=int)
-            for node in range(0, self.header['nr_nodes']):
-                new_index = np.where(nodes_raw[:, 0].astype(int) == (node + 1))
-                nodes_cutmck[new_index[0], 1:3] = nodes_raw[node, 1:3]
-                nodes_cutmck[new_index[0], 0] = new_index[0]
-                nodes_cutmck_index[node] = new_index[0]
+            nodes_cutmck[nodes_cutmck_index, 1:3] = nodes_raw[:, 1:3]
+            nodes_cutmck[nodes_cutmck_index, 0] = nodes_cutmck_index
             # sort them
             nodes_sorted = nodes_cutmck[nodes_cutmck_index, :]
             nodes['presort'] = nodes_cutmck
@@ -299,6 +314,13 @@ class crt_grid(object):
         TODO: We want some nice way of not needing to know in the future if we
               loaded triangles or quadratic elements.
         """
+        # invalidate all quantities cached for a previously loaded grid
+        self.centroids = None
+        self.element_areas = None
+        self.element_polygons = None
+        self.element_neighbors_data = None
+        self.element_neighbors_edges = None
+
         if(self.header['element_infos'][0, 2] == 3):
             print('Triangular grid found')
             self.grid_is_rectangular = False
@@ -426,8 +448,12 @@ class crt_grid(object):
 
     def _write_elements(self, fid):
         for dtype in self.header['element_infos'][:, 0]:
-            for elm in self.element_data[dtype]:
-                np.savetxt(fid, np.atleast_2d(elm.nodes), fmt='%i')
+            # all elements of one type have the same number of nodes, so we
+            # can write them in one go
+            element_nodes = np.array(
+                [elm.nodes for elm in self.element_data[dtype]]
+            )
+            np.savetxt(fid, element_nodes, fmt='%i')
 
     def _write_nodes(self, fid):
         np.savetxt(fid, self.nodes['raw'], fmt='%i %f %f')
@@ -474,10 +500,7 @@ class crt_grid(object):
         plot_electrode_numbers: bool, optional
             Plot electrode numbers in the grid, default: False
         """
-        all_xz = []
-        for x, z in zip(self.grid['x'], self.grid['z']):
-            tmp = np.vstack((x, z)).T
-            all_xz.append(tmp)
+        all_xz = self.get_element_polygons()
         collection = mpl.collections.PolyCollection(
             all_xz,
             edgecolor='k',
@@ -519,10 +542,7 @@ class crt_grid(object):
     def test_plot(self):
         # play with plot routines
         fig, ax = plt.subplots(1, 1)
-        all_xz = []
-        for x, z in zip(self.grid['x'], self.grid['z']):
-            tmp = np.vstack((x, z)).T
-            all_xz.append(tmp)
+        all_xz = self.get_element_polygons()
         collection = mpl.collections.PolyCollection(all_xz, edgecolor='r')
         ax.add_collection(collection)
         ax.scatter(self.electrodes[:, 1], self.electrodes[:, 2])
@@ -532,6 +552,21 @@ class crt_grid(object):
         fig.savefig('test.png', dpi=300)
         return fig, ax
 
+    def get_element_polygons(self):
+        """return the node coordinates of all elements, e.g., for use with
+        a matplotlib PolyCollection
+
+        Returns
+        -------
+        polygons: numpy.ndarray
+            NxKx2 array with x/z coordinates of the K nodes of all (N)
+            elements
+        """
+        if self.element_polygons is None:
+            self.element_polygons = np.dstack((self.grid['x'], self.grid['z']))
+
+        return self.element_polygons
+
     def get_element_centroids(self):
         """return the central points of all elements
 
@@ -541,10 +576,10 @@ class crt_grid(object):
             Nx2 array x/z coordinates for all (N) elements
         """
         if self.centroids is None:
-            self.centroids = np.vstack((
-                np.mean(self.grid['x'], axis=1),
-                np.mean(self.grid['z'], axis=1)
-            )).T
+            # write the means directly into the columns of the result
+            self.centroids = np.empty((self.grid['x'].shape[0], 2))
+            np.mean(self.grid['x'], axis=1, out=self.centroids[:, 0])
+            np.mean(self.grid['z'], axis=1, out=self.centroids[:, 1])
 
         return self.centroids
 
@@ -576,12 +611,17 @@ class crt_grid(object):
         -------
         areas : numpy.ndarray
         """
-        areas = [
-            self._get_area_polygon(
-                points_x, points_z
-            ) for points_x, points_z in zip(self.grid['x'], self.grid['z'])
-        ]
-        return np.array(areas)
+        if self.element_areas is None:
+            # shoelace formula (see _get_area_polygon), evaluated for all
+            # elements at once
+            x = self.grid['x']
+            z = self.grid['z']
+            self.element_areas = np.abs(np.sum(
+                (np.roll(x, 1, axis=1) + x) * (np.roll(z, 1, axis=1) - z),
+                axis=1,
+            ) / 2)
+
+        return self.element_areas
 
     def get_electrode_positions(self):
         """Return the electrode positions in an numpy.ndarray
@@ -616,26 +656,21 @@ class crt_grid(object):
             NxK array with N the number of elements, and K the number of nodes,
             filled with the internal angles in degrees
         """
-
-        angles = []
-
-        for elx, elz in zip(self.grid['x'], self.grid['z']):
-            el_angles = []
-            xy = np.vstack((elx, elz))
-            for i in range(0, elx.size):
-                i1 = (i - 1) % elx.size
-                i2 = (i + 1) % elx.size
-
-                a = (xy[:, i] - xy[:, i1])
-                b = (xy[:, i2] - xy[:, i])
-                # note that nodes are ordered counter-clockwise!
-                angle = np.pi - np.arctan2(
-                    a[0] * b[1] - a[1] * b[0],
-                    a[0] * b[0] + a[1] * b[1]
-                )
-                el_angles.append(angle * 180 / np.pi)
-            angles.append(el_angles)
-        return np.array(angles)
+        x = self.grid['x']
+        z = self.grid['z']
+
+        # edge vectors pointing to (a) and away from (b) each node
+        a_x = x - np.roll(x, 1, axis=1)
+        a_z = z - np.roll(z, 1, axis=1)
+        b_x = np.roll(x, -1, axis=1) - x
+        b_z = np.roll(z, -1, axis=1) - z
+
+        # note that nodes are ordered counter-clockwise!
+        angles = np.pi - np.arctan2(
+            a_x * b_z - a_z * b_x,
+            a_x * b_x + a_z * b_z
+        )
+        return angles * 180 / np.pi
 
     def analyze_internal_angles(self, return_plot=False):
         """Analyze the internal angles of the grid. Angles shouldn't be too
@@ -708,12 +743,9 @@ class crt_grid(object):
         elements. Note that the elements are not sorted. No spacial orientation
         can be inferred from the order of neighbors.
 
-        WARNING: This function is slow due to a nested loop. This would be a
-        good starting point for further optimizations.
-
-        In order to speed things up, we could search using the raw data, i.e.,
-        with CutMcK enabled sorting, and then restrict the loops to 2x the
-        bandwidth (before - after).
+        Neighbors are found by first building a lookup table that maps each
+        node to the elements it belongs to. Only elements sharing at least one
+        node are then checked for a common edge, i.e., two common nodes.
 
         While not being returned, this function also sets the variable
         self.element_neighbors_edges, in which the common nodes with each
@@ -741,22 +773,31 @@ class crt_grid(object):
         # determine neighbors
         print('Looking for neighbors')
         time_start = time.time()
+
+        # map each node to the (sorted) list of elements it belongs to
+        node_to_elements = {}
+        for nr, element_nodes in enumerate(self.elements.tolist()):
+            for node in element_nodes:
+                node_to_elements.setdefault(node, []).append(nr)
+
         for nr, element_nodes in enumerate(self.elements):
-            # print('element {0}/{1}'.format(nr + 1, self.nr_of_elements))
-            # print(element_nodes)
-            neighbors = []
-            neighbors_edges = []  # store the edges to this neighbor
-            for nr1, el in enumerate(self.elements):
-                # we look for elements that have two nodes in common with this
-                # element
-                intersection = np.intersect1d(element_nodes, el)
-                if intersection.size == 2:
-                    neighbors.append(nr1)
-                    neighbors_edges.append(intersection)
-                    # stop if we reached the maximum number of possible edges
-                    # this saves us quite some loop iterations
-                    if len(neighbors) == max_nr_edges:
-                        break
+            # count the number of nodes each candidate element has in common
+            # with this element
+            nr_common_nodes = {}
+            for node in element_nodes.tolist():
+                for nr1 in node_to_elements[node]:
+                    nr_common_nodes[nr1] = nr_common_nodes.get(nr1, 0) + 1
+
+            # we look for elements that have two nodes in common with this
+            # element
+            neighbors = sorted(
+                nr1 for nr1, count in nr_common_nodes.items() if count == 2
+            )[0:max_nr_edges]
+            # store the edges to this neighbor
+            neighbors_edges = [
+                np.intersect1d(element_nodes, self.elements[nr1])
+                for nr1 in neighbors
+            ]
             self.element_neighbors_data.append(neighbors)
             self.element_neighbors_edges.append(neighbors_edges)
         time_end = time.time()
@@ -1102,8 +1143,9 @@ class crt_grid(object):
             Array with indices (zero-indexed)
         """
         centroids = self.get_element_centroids()
-        indices_list = []
-        for nr, (x, z) in enumerate(centroids):
-            if x >= xmin and x <= xmax and z >= zmin and z <= zmax:
-                indices_list.append(nr)
-        return np.array(indices_list)
+        x = centroids[:, 0]
+        z = centroids[:, 1]
+        indices = np.where(
+            (x >= xmin) & (x <= xmax) & (z >= zmin) & (z <= zmax)
+        )[0]
+        return indices
@@ -4,6 +4,7 @@
 """
 import numpy as np
 import scipy.interpolate
+import scipy.spatial
 from mpl_toolkits.axes_grid1 import make_axes_locatable
 
 # from crtomo.mpl_setup import *
@@ -62,6 +63,34 @@ class plotManager(object):
         # par manager
         self.parman = kwargs.get('pm', pM.ParMan(self.grid))
 
+        # will be used for caching by ._get_node_triangulation
+        self._node_triangulation = None
+
+    def _get_node_triangulation(self):
+        """Return the Delaunay triangulation of the node positions. The
+        triangulation is computed only once for a given set of nodes and then
+        reused for all node plots.
+        """
+        nodes = self.grid.nodes['presort']
+        if(self._node_triangulation is None or
+           self._node_triangulation[0] is not nodes):
+            self._node_triangulation = (
+                nodes,
+                scipy.spatial.Delaunay(nodes[:, 1:3]),
+            )
+        return self._node_triangulation[1]
+
+    def _interpolate_nodes(self, values, X, Z):
+        """Linearly interpolate node values to the points (X, Z). Points
+        outside the grid are set to NaN.
+        """
+        interpolator = scipy.interpolate.LinearNDInterpolator(
+            self._get_node_triangulation(),
+            values,
+            fill_value=np.nan,
+        )
+        return interpolator(X, Z)
+
     def plot_nodes_pcolor_to_ax(self, ax, nid, **kwargs):
         """Plot node data to an axes object
 
@@ -86,7 +115,6 @@ class plotManager(object):
         x = self.grid.nodes['presort'][:, 1]
         z = self.grid.nodes['presort'][:, 2]
         ax.scatter(x, z)
-        xz = np.vstack((x, z)).T
 
         # generate grid
         X, Z = np.meshgrid(
@@ -95,17 +123,7 @@ class plotManager(object):
         )
 
         values = np.array(self.nodeman.nodevals[nid])
-        # linear
-        # cubic
-        cint = scipy.interpolate.griddata(
-            xz,
-            values,
-            (X, Z),
-            method='linear',
-            # method='linear',
-            # method='nearest',
-            fill_value=np.nan,
-        )
+        cint = self._interpolate_nodes(values, X, Z)
         cint_ma = np.ma.masked_invalid(cint)
 
         pc = ax.pcolormesh(
@@ -181,7 +199,6 @@ class plotManager(object):
 
         x = self.grid.nodes['presort'][:, 1]
         z = self.grid.nodes['presort'][:, 2]
-        xz = np.vstack((x, z)).T
 
         # generate grid
         X, Z = np.meshgrid(
@@ -190,17 +207,7 @@ class plotManager(object):
         )
 
         values = np.array(self.nodeman.nodevals[nid])
-        # linear
-        # cubic
-        cint = scipy.interpolate.griddata(
-            xz,
-            values,
-            (X, Z),
-            method='linear',
-            # method='linear',
-            # method='nearest',
-            fill_value=np.nan,
-        )
+        cint = self._interpolate_nodes(values, X, Z)
         cint_ma = np.ma.masked_invalid(cint)
 
         pc = ax.contourf(
@@ -236,7 +243,6 @@ class plotManager(object):
         # node locations
         x = self.grid.nodes['presort'][:, 1]
         z = self.grid.nodes['presort'][:, 2]
-        xz = np.vstack((x, z)).T
 
         # generate grid
         X, Z = np.meshgrid(
@@ -245,18 +251,7 @@ class plotManager(object):
         )
 
         values = np.array(self.nodeman.nodevals[cid])
-
-        # linear
-        # cubic
-        cint = scipy.interpolate.griddata(
-            xz,
-            values,
-            (X, Z),
-            method='linear',
-            # method='linear',
-            # method='nearest',
-            fill_value=np.nan,
-        )
+        cint = self._interpolate_nodes(values, X, Z)
         cint_ma = np.ma.masked_invalid(cint)
 
         print(cint_ma.shape)
@@ -460,10 +455,7 @@ class plotManager(object):
                 )
             fcolors[:, 3] = alpha
 
-        all_xz = []
-        for x, z in zip(self.grid.grid['x'], self.grid.grid['z']):
-            tmp = np.vstack((x, z)).T
-            all_xz.append(tmp)
+        all_xz = self.grid.get_element_polygons()
 
         norm = kwargs.get('norm', None)
 
@@ -1013,53 +1013,61 @@ class tdMan(object):
             Path to volt.dat file
         """
 
-        measurements_raw = np.loadtxt(
+        measurements = pd.read_csv(
             voltage_file,
+            sep=r'\s+',
+            header=None,
             skiprows=1,
-        )
-        measurements = np.atleast_2d(measurements_raw)
+            engine='c',
+            dtype=np.float64,
+        ).to_numpy()
 
         # extract measurement configurations
-        A = (measurements[:, 0] / 1e4).astype(int)
-        B = (measurements[:, 0] % 1e4).astype(int)
-        M = (measurements[:, 1] / 1e4).astype(int)
-        N = (measurements[:, 1] % 1e4).astype(int)
-        ABMN = np.vstack((A, B, M, N)).T
+        ABMN = np.empty((measurements.shape[0], 4), dtype=np.int64)
+        ABMN[:, 0], ABMN[:, 1] = np.divmod(
+            measurements[:, 0].astype(np.int64), 10000
+        )
+        ABMN[:, 2], ABMN[:, 3] = np.divmod(
+            measurements[:, 1].astype(np.int64), 10000
+        )
 
         if self.configs.configs is None:
             self.configs.configs = ABMN
         else:
-            # configurations don't match
-            if not np.all(ABMN == self.configs.configs):
-                for nr, (old_config, new_config) in enumerate(zip(
-                        self.configs.configs, ABMN)):
-
-                    if np.all(old_config == new_config):
-                        continue
-                    # check polarity
-                    current_electrodes_are_equal = np.all(
-                        old_config[0:2] == new_config[0:2]
-                    )
-                    voltage_electrodes_are_switched = np.all(
-                        old_config[2:4] == new_config[4:1:-1]
+            old_configs = self.configs.configs
+            if old_configs.shape != ABMN.shape:
+                raise Exception(
+                    'There was an error matching configurations of ' +
+                    'voltages with configurations already imported'
+                )
+            # configurations that don't match
+            indices = np.where(np.any(old_configs != ABMN, axis=1))[0]
+            if indices.size > 0:
+                # check polarity
+                current_electrodes_are_equal = np.all(
+                    old_configs[indices, 0:2] == ABMN[indices, 0:2],
+                    axis=1,
+                )
+                voltage_electrodes_are_switched = np.all(
+                    old_configs[indices, 2:4] == ABMN[indices, 4:1:-1],
+                    axis=1,
+                )
+
+                if not np.all(current_electrodes_are_equal &
+                              voltage_electrodes_are_switched):
+                    raise Exception(
+                        'There was an error matching configurations of ' +
+                        'voltages with configurations already imported'
                     )
 
-                    if(current_electrodes_are_equal and
-                       voltage_electrodes_are_switched):
-
-                        if len(self.configs.measurements.keys()) > 0:
-                            raise Exception(
-                                'need to switch electrode polarity, but ' +
-                                'there are already measurements stored for ' +
-                                'the old configuration!')
-                        else:
-                            # switch M/N in configurations
-                            self.configs.configs[nr, :] = new_config
-                    else:
-                        raise Exception(
-                            'There was an error matching configurations of ' +
-                            'voltages with configurations already imported'
-                        )
+                if len(self.configs.measurements.keys()) > 0:
+                    raise Exception(
+                        'need to switch electrode polarity, but ' +
+                        'there are already measurements stored for ' +
+                        'the old configuration!')
+                else:
+                    # switch M/N in configurations
+                    old_configs[indices, :] = ABMN[indices, :]
 
         # add measurements to the config instance
         mid_mag = self.configs.add_measurements(
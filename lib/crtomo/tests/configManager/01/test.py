@@ -0,0 +1,217 @@
+import os
+import tempfile
+
+import numpy as np
+
+import crtomo.configManager as CRConfig
+
+
+def setup_func():
+    pass
+
+
+def teardown_func():
+    pass
+
+
+def _get_config_manager():
+    config = CRConfig.ConfigManager(nr_of_electrodes=10)
+    config.gen_dipole_dipole(skipc=0)
+    return config
+
+
+def test_add_delete_readd():
+    config = _get_config_manager()
+    N = config.nr_of_configs
+    data1 = np.random.rand(N)
+    data2 = np.random.rand(N)
+    mid1 = config.add_measurements(data1)
+    mid2 = config.add_measurements(data2)
+    assert mid1 != mid2
+    assert np.all(config.measurements[mid1] == data1)
+    assert np.all(config.measurements[mid2] == data2)
+
+    config.delete_measurements(mid1)
+    assert mid1 not in config.measurements
+    assert np.all(config.measurements[mid2] == data2)
+
+    data3 = np.random.rand(N)
+    mid3 = config.add_measurements(data3)
+    assert mid3 not in (mid1, mid2)
+    assert np.all(config.measurements[mid2] == data2)
+    assert np.all(config.measurements[mid3] == data3)
+
+
+def test_growth_past_capacity():
+    config = _get_config_manager()
+    N = config.nr_of_configs
+    data = np.random.rand(20, N)
+    mids = [config.add_measurements(subdata) for subdata in data]
+    assert len(set(mids)) == 20
+    for mid, subdata in zip(mids, data):
+        assert np.all(config.measurements[mid] == subdata)
+
+
+def test_delete_data_points():
+    config = _get_config_manager()
+    N = config.nr_of_configs
+    data = np.random.rand(N)
+    int_data = np.arange(N)
+    nocopy_data = np.random.rand(N)
+    mid = config.add_measurements(data)
+    mid_int = config.add_measurements(int_data)
+    mid_nocopy = config.add_measurements(nocopy_data, copy=False)
+
+    config.delete_data_points([0, 3])
+    assert config.configs.shape[0] == N - 2
+    assert np.all(config.measurements[mid] == np.delete(data, [0, 3]))
+    assert np.all(config.measurements[mid_int] == np.delete(int_data, [0, 3]))
+    assert np.all(
+        config.measurements[mid_nocopy] == np.delete(nocopy_data, [0, 3])
+    )
+
+    # the remaining data can still be extended
+    data2 = np.random.rand(N - 2)
+    mid2 = config.add_measurements(data2)
+    assert np.all(config.measurements[mid2] == data2)
+    assert np.all(config.measurements[mid] == np.delete(data, [0, 3]))
+
+
+def test_clear_measurements():
+    config = _get_config_manager()
+    N = config.nr_of_configs
+    config.add_measurements(np.random.rand(3, N))
+    config.clear_measurements()
+    assert len(config.measurements) == 0
+
+    data = np.random.rand(N)
+    mid = config.add_measurements(data)
+    assert mid == 0
+    assert np.all(config.measurements[mid] == data)
+
+
+def test_rebound_measurement_is_kept():
+    config = _get_config_manager()
+    N = config.nr_of_configs
+    config.add_measurements(np.random.rand(N))
+    mid = config.add_measurements(np.random.rand(N))
+    config.measurements[mid] = np.zeros(N)
+    for i in range(10):
+        config.add_measurements(np.random.rand(N))
+    assert np.all(config.measurements[mid] == 0)
+
+    config.delete_data_points([0])
+    assert np.all(config.measurements[mid] == 0)
+    assert config.measurements[mid].size == N - 1
+
+
+def test_deleted_measurement_is_not_overwritten():
+    config = _get_config_manager()
+    N = config.nr_of_configs
+    data = np.random.rand(N)
+    mid = config.add_measurements(data)
+    config.add_measurements(np.random.rand(N))
+    reference = config.measurements[mid]
+    config.delete_measurements(mid)
+    for i in range(5):
+        config.add_measurements(np.ones(N))
+    assert np.all(reference == data)
+
+
+def test_volt_binary_roundtrip():
+    config = _get_config_manager()
+    N = config.nr_of_configs
+    mag = np.random.rand(N)
+    pha = np.random.rand(N)
+    mid_mag = config.add_measurements(mag)
+    mid_pha = config.add_measurements(pha)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for mid, pha_ref in (
+                ([mid_mag, mid_pha], pha),
+                (mid_mag, np.zeros(N))):
+            filename = os.path.join(directory, 'volt.bin')
+            config.write_crmod_volt_binary(filename, mid)
+
+            # fresh manager: configurations are read from the file
+            config_new = CRConfig.ConfigManager(nr_of_electrodes=10)
+            cid_mag, cid_pha = config_new.load_crmod_volt_binary(filename)
+            assert np.all(config_new.configs == config.configs)
+            assert np.all(config_new.measurements[cid_mag] == mag)
+            assert np.all(config_new.measurements[cid_pha] == pha_ref)
+
+            # manager with configurations: these are checked against the file
+            config_old = _get_config_manager()
+            cid_mag, cid_pha = config_old.load_crmod_volt_binary(filename)
+            assert np.all(config_old.measurements[cid_mag] == mag)
+            assert np.all(config_old.measurements[cid_pha] == pha_ref)
+
+
+def test_volt_binary_truncated_file():
+    config = _get_config_manager()
+    mid = config.add_measurements(np.random.rand(config.nr_of_configs))
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, 'volt.bin')
+        config.write_crmod_volt_binary(filename, mid)
+        with open(filename, 'rb+') as fid:
+            fid.truncate(os.path.getsize(filename) - 8)
+
+        config_new = CRConfig.ConfigManager(nr_of_electrodes=10)
+        try:
+            config_new.load_crmod_volt_binary(filename)
+        except Exception as e:
+            assert 'indicated number of measurements' in str(e)
+        else:
+            assert False
+
+
+def test_add_measurements_nocopy():
+    config = _get_config_manager()
+    N = config.nr_of_configs
+    data = np.random.rand(N)
+    mid = config.add_measurements(data, copy=False)
+    assert config.measurements[mid] is data
+
+    data_2d = np.random.rand(3, N)
+    mids = config.add_measurements(data_2d, copy=False)
+    for mid, subdata in zip(mids, data_2d):
+        assert np.shares_memory(config.measurements[mid], data_2d)
+        assert np.all(config.measurements[mid] == subdata)
+
+
+def test_add_measurements_transposed():
+    config = _get_config_manager()
+    N = config.nr_of_configs
+    # N x K input, i.e., one measurement set per column
+    data = np.random.rand(N, 3)
+    for copy in (True, False):
+        mids = config.add_measurements(data, copy=copy)
+        assert len(mids) == 3
+        for index, mid in enumerate(mids):
+            assert config.measurements[mid].flags['C_CONTIGUOUS']
+            assert np.all(config.measurements[mid] == data[:, index])
+
+
+def test_add_measurements_ids():
+    config = _get_config_manager()
+    N = config.nr_of_configs
+    data = np.random.rand(4, N)
+    for copy in (True, False):
+        config.clear_measurements()
+
+        # 1D input returns a single id
+        mid = config.add_measurements(data[0], copy=copy)
+        assert mid == 0
+        assert np.all(config.measurements[mid] == data[0])
+
+        # one measurement set in 2D also returns a single id
+        mid = config.add_measurements(data[1:2], copy=copy)
+        assert mid == 1
+        assert np.all(config.measurements[mid] == data[1])
+
+        # multiple measurement sets return a list of consecutive ids
+        mids = config.add_measurements(data[2:], copy=copy)
+        assert mids == [2, 3]
+        for mid, subdata in zip(mids, data[2:]):
+            assert np.all(config.measurements[mid] == subdata)
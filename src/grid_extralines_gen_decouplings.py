@@ -335,10 +335,7 @@ def debug_plot(grid, extra_lines, decoupling_elements, options,):
     print('Creating debug plot...')
     fig, ax = plt.subplots(1, 1, figsize=(10, 10))
 
-    all_xz = []
-    for x, z in zip(grid.grid['x'], grid.grid['z']):
-        tmp = np.vstack((x, z)).T
-        all_xz.append(tmp)
+    all_xz = grid.get_element_polygons()
 
     collection = mpl.collections.PolyCollection(
         all_xz,
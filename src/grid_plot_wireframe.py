@@ -100,10 +100,7 @@ def plot_wireframe(options):
     zmax = grid.grid['z'].max()
 
     fig, ax = plt.subplots(1, 1, frameon=False)
-    all_xz = []
-    for x, z in zip(grid.grid['x'], grid.grid['z']):
-        tmp = np.vstack((x, z)).T
-        all_xz.append(tmp)
+    all_xz = grid.get_element_polygons()
     collection = mpl.collections.PolyCollection(
         all_xz,
         edgecolor='k',